@@ -1,10 +1,18 @@
 """Initialises the Flask application, database, and configures extensions."""
 import os
+import sqlite3
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
-from flask import Flask
+from jinja2 import FileSystemBytecodeCache
+
+from flask import Flask, g, has_request_context, request
+from flask_caching import Cache
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
 from flask_login import LoginManager
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 
 from config import Config
 
@@ -14,14 +22,98 @@ login = LoginManager()
 login.login_view = 'login'
 app = Flask(__name__)
 app.config.from_object(Config)
-db = SQLAlchemy() 
+db = SQLAlchemy()
+
+# In-process cache for expensive per-user view assemblies (e.g. the
+# training dashboard lists); entries are short-lived and explicitly
+# invalidated when the underlying progress data changes
+cache = Cache(app, config={
+    'CACHE_TYPE': 'SimpleCache',
+    'CACHE_DEFAULT_TIMEOUT': 60,
+})
 
 os.makedirs(app.config['PROFILE_PHOTO_FOLDER'], exist_ok=True)
 
+# Small pool for filesystem work (e.g. profile photo writes) so slow
+# disk I/O doesn't hold a WSGI worker for the whole request
+app.executor = ThreadPoolExecutor(max_workers=4)
+
+# Persist compiled templates across processes and, outside debug, skip
+# the per-render template mtime check, so requests only pay for
+# rendering rather than parse + compile
+_jinja_cache_dir = os.path.join(tempfile.gettempdir(), 'visionhub-jinja-cache')
+os.makedirs(_jinja_cache_dir, exist_ok=True)
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache(_jinja_cache_dir)
+if not app.debug:
+    app.jinja_env.auto_reload = False
+
 db.init_app(app)
 migrate.init_app(app, db)
 login.init_app(app)
 
+# Server-side sessions: with Redis configured, each request does one
+# O(1) key lookup instead of verifying and deserialising the whole
+# session payload out of the cookie; without it the default signed
+# cookie keeps development dependency-free
+if app.config['SESSION_REDIS_URL']:
+    import redis
+    from flask_session import Session
+
+    app.config['SESSION_TYPE'] = 'redis'
+    app.config['SESSION_PERMANENT'] = False
+    app.config['SESSION_REDIS'] = redis.Redis.from_url(
+        app.config['SESSION_REDIS_URL']
+    )
+    Session(app)
+
+
+@event.listens_for(Engine, 'connect')
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Applies performance pragmas to every new SQLite connection.
+
+    WAL mode lets readers proceed while a writer holds the database, and
+    the remaining pragmas reduce fsync and read syscall overhead. Other
+    database backends (e.g. Postgres in production) are left untouched.
+    """
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.execute('PRAGMA mmap_size=268435456')
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    cursor.execute('PRAGMA cache_size=-65536')
+    cursor.close()
+
+# Per-request SQL budget, enforced only outside production: a view that
+# starts issuing more queries than this has usually regressed into an
+# N+1 pattern that the eager-loading setup was meant to prevent
+_QUERY_BUDGET = 8
+
+if app.debug or app.testing:
+    @event.listens_for(Engine, 'before_cursor_execute')
+    def count_request_queries(conn, cursor, statement, parameters,
+                              context, executemany):
+        """Counts SQL statements issued during the current request."""
+        if has_request_context():
+            g.query_count = g.get('query_count', 0) + 1
+
+    @app.after_request
+    def warn_on_query_budget(response):
+        """Logs a warning when a request exceeds the query budget."""
+        count = g.get('query_count', 0)
+        if count > _QUERY_BUDGET:
+            app.logger.warning(
+                'Query budget exceeded: %s issued %d queries (budget %d)',
+                request.path, count, _QUERY_BUDGET
+            )
+        return response
+
 from app import routes, models
 from app.admin import routes
 
+# Warm the template cache at startup so the first request after a
+# deploy renders from compiled bytecode instead of paying the parse
+for _name in app.jinja_env.list_templates(extensions=['html']):
+    app.jinja_env.get_template(_name)
+
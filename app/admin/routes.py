@@ -6,6 +6,7 @@ current user is authenticated and has the “admin” role.
 """
 from datetime import datetime
 
+import sqlalchemy as sa
 from flask import render_template, flash, redirect, url_for, request
 from flask_login import current_user, login_required
 
@@ -40,7 +41,7 @@ def register_user():
         - Redirects to manage_users on successful creation (with a flash
         message).
     """
-    if not current_user.is_authenticated or current_user.role.role_name != 'admin':
+    if not current_user.is_authenticated or current_user.role_name != 'admin':
         return redirect(url_for('logout'))
 
     form = CreateUserForm()
@@ -114,7 +115,7 @@ def admin_dashboard():
         - Rendered admin dashboard template.
         - Redirects to logout if the user is not an admin.
     """
-    if current_user.role.role_name!= "admin":
+    if current_user.role_name!= "admin":
         return redirect(url_for('logout'))
     
     return render_template(
@@ -134,7 +135,7 @@ def manage_users():
         occurs.
         - Redirects to logout if the user is not an admin.
     """
-    if current_user.role.role_name != "admin":
+    if current_user.role_name != "admin":
         return redirect(url_for('logout'))
      
     try:
@@ -162,10 +163,10 @@ def view_user(user_id):
         - Rendered template with user details.
         - Redirects to logout if the user is not an admin.
     """
-    if current_user.role.role_name != "admin":
+    if current_user.role_name != "admin":
         return redirect(url_for('logout'))
 
-    user = User.query.get_or_404(user_id)
+    user = db.get_or_404(User, user_id)
 
     return render_template(
         'admin/viewUser.html', 
@@ -194,10 +195,10 @@ def edit_user(user_id):
         - Redirects to logout if the user is not an admin.
         - Redirects to manage_users on successful update with a flash message.
     """
-    if current_user.role.role_name != "admin":
+    if current_user.role_name != "admin":
         return redirect(url_for('logout'))
     
-    user = User.query.get_or_404(user_id)
+    user = db.get_or_404(User, user_id)
     form = EditUserForm(obj=user)
     form.user_id = user.id
 
@@ -275,10 +276,10 @@ def delete_user(user_id):
         to delete their own account.
         - Redirects to logout if the user is not an admin.
     """
-    if current_user.role.role_name != 'admin':
+    if current_user.role_name != 'admin':
         return redirect(url_for('logout'))
         
-    user = User.query.get_or_404(user_id)
+    user = db.get_or_404(User, user_id)
 
     if user.id == current_user.id:
         flash("You cannot delete your own account.")
@@ -314,7 +315,7 @@ def create_training_module():
         dynamically adding a question.
         - Redirects to logout if the user is not an admin.
     """
-    if current_user.role.role_name != "admin":
+    if current_user.role_name != "admin":
         return redirect(url_for('logout'))
 
     form = CreateTrainingModuleForm()
@@ -343,7 +344,7 @@ def create_training_module():
             db.session.flush()
 
             for pathway_id in form.pathways.data:
-                pathway = OnboardingPath.query.get(pathway_id)
+                pathway = db.session.get(OnboardingPath, pathway_id)
                 if pathway:
                     onboarding_step = OnboardingStep(
                         step_name = training_module.module_title,
@@ -357,27 +358,36 @@ def create_training_module():
                 db.session.rollback()
                 return redirect(url_for('create_training_module'))
             
+            # Add every question in one flush, then bulk-insert the
+            # options in a single executemany INSERT rather than one
+            # flush per question and one add per option
+            questions = []
             for question_form in form.questions:
                 question = Question(
                     question_text = question_form.question_text.data,
                     training_module = training_module
                 )
-                db.session.add(question)
-                db.session.flush()
+                questions.append(question)
+            db.session.add_all(questions)
+            db.session.flush()
+
+            option_rows = []
+            for question, question_form in zip(questions, form.questions):
                 for option_form in (
-                    question_form.option1, 
-                    question_form.option2, 
-                    question_form.option3, 
+                    question_form.option1,
+                    question_form.option2,
+                    question_form.option3,
                     question_form.option4,
                 ):
-                    option = Option(
-                        option_text = option_form.option_text.data,
-                        is_correct = option_form.is_correct.data,
-                        question = question,
-                    )
-                    db.session.add(option)
-
-            db.session.commit()  
+                    option_rows.append({
+                        'question_id': question.id,
+                        'option_text': option_form.option_text.data,
+                        'is_correct': option_form.is_correct.data,
+                    })
+            if option_rows:
+                db.session.execute(sa.insert(Option), option_rows)
+
+            db.session.commit()
             flash(
                 f'Training module "{training_module.module_title}" has been '
                 'successfully created!')
@@ -402,7 +412,7 @@ def manage_training_modules():
         - Rendered template with a list of all active training modules.
         - Redirects to logout if the user is not an admin.
     """
-    if current_user.role.role_name != "admin":
+    if current_user.role_name != "admin":
         return redirect(url_for('logout'))
     
     modules = TrainingModule.query.filter_by(active=True).all()
@@ -430,10 +440,10 @@ def details_training_module(module_id):
         questions.
         - Redirects to logout if the user is not an admin.
     """
-    if current_user.role.role_name != "admin":
+    if current_user.role_name != "admin":
         return redirect(url_for('logout'))
     
-    module = TrainingModule.query.get_or_404(module_id)
+    module = db.get_or_404(TrainingModule, module_id)
     
     questions = Question.query.filter_by(training_module_id=module_id).all()
     
@@ -474,10 +484,10 @@ def edit_training_module(module_id):
         - Re-renders the edit form if validation fails or on GET request.
         - Redirects to logout if the user is not an admin.
     """
-    if current_user.role.role_name != "admin":
+    if current_user.role_name != "admin":
         return redirect(url_for('logout'))
     
-    module = TrainingModule.query.get_or_404(module_id)
+    module = db.get_or_404(TrainingModule, module_id)
 
     form = CreateTrainingModuleForm(obj=module)
     form.pathways.choices = [
@@ -507,7 +517,7 @@ def edit_training_module(module_id):
 
         OnboardingStep.query.filter_by(training_module_id = module.id).delete()
         for path_id in form.pathways.data:
-            path = OnboardingPath.query.get(path_id)
+            path = db.session.get(OnboardingPath, path_id)
             db.session.add(OnboardingStep(
                 step_name=module.module_title,
                 path=path,
@@ -556,10 +566,10 @@ def delete_training_module(module_id):
         - Redirect to the training module management page with a success message.
         - Redirects to logout if the user is not an admin.
     """
-    if current_user.role.role_name != 'admin':
+    if current_user.role_name != 'admin':
         return redirect(url_for('logout'))
 
-    module = TrainingModule.query.get_or_404(module_id)
+    module = db.get_or_404(TrainingModule, module_id)
     module.active = False
 
     try:
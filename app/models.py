@@ -21,19 +21,116 @@
         - OnboardingPath: Represents onboarding paths for different staff types.
         - OnboardingStep: Represents steps in an onboarding path, such as 
         training modules.
+        - ModuleCompletionStats: Pre-aggregated completion figures per
+        training module.
         - DocumentRepository: Represents documents in the repository.
         - Report: Represents reports generated in the system.
 """ 
+import hashlib
+import hmac
+from contextlib import contextmanager
 from datetime import datetime, timezone
+from enum import IntEnum
 from typing import Optional, List
 
+from flask import current_app, g
 from flask_login import UserMixin
+from passlib.context import CryptContext
 import sqlalchemy as sa
 import sqlalchemy.orm as so
 from sqlalchemy import Boolean
-from werkzeug.security import generate_password_hash, check_password_hash
+from sqlalchemy.dialects.postgresql import JSONB
+from werkzeug.security import check_password_hash
 
 from app import db, login
+from config import Config
+
+# Public model and enum names; the shell context in visionHub.py is
+# built from this list so it never drifts from the models themselves
+__all__ = [
+    'DocumentCategory',
+    'ReportType',
+    'User',
+    'Role',
+    'Department',
+    'TrainingModule',
+    'Question',
+    'Option',
+    'UserModuleProgress',
+    'UserQuestionAnswer',
+    'ModuleCompletionStats',
+    'OnboardingPath',
+    'OnboardingStep',
+    'DocumentRepository',
+    'Report',
+]
+
+
+# Password hashing context. The argon2 cost parameters come from
+# config so each deployment can calibrate a single verify to its
+# latency budget; hashes created under older parameters (or with
+# werkzeug before the argon2 switch) are verified and re-hashed
+# transparently on the next successful login.
+pwd_context = CryptContext(
+    schemes = ['argon2'],
+    argon2__time_cost = Config.ARGON2_TIME_COST,
+    argon2__memory_cost = Config.ARGON2_MEMORY_COST,
+    argon2__parallelism = Config.ARGON2_PARALLELISM,
+    deprecated = 'auto'
+)
+
+
+def _hash_fragment(password_hash):
+    """Returns a short digest of a password hash for session tokens.
+
+    A truncated SHA-256 of the full hash string: unlike a prefix of the
+    PHC-format hash (which is constant algorithm metadata), the digest
+    covers the salt and hash output, so it differs per user and changes
+    whenever the password or its cost parameters change.
+    """
+    return hashlib.sha256((password_hash or '').encode()).hexdigest()[:12]
+
+
+class DocumentCategory(IntEnum):
+    """Categories a repository document can belong to."""
+    POLICY = 1
+    GUIDE = 2
+    FORM = 3
+
+
+class ReportType(IntEnum):
+    """Kinds of report the system can generate."""
+    COMPLETION = 1
+    PERFORMANCE = 2
+
+
+class IntEnumType(sa.types.TypeDecorator):
+    """Stores a Python IntEnum as a SmallInteger column.
+
+    Avoids native SQL ENUM types, which serialize as strings on every
+    fetch and require an ALTER TYPE on Postgres to extend. New members
+    only need a new IntEnum value.
+    """
+    impl = sa.SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._enum_class = enum_class
+
+    def process_bind_param(self, value, dialect):
+        """Converts an IntEnum (or its name/value) to the stored integer."""
+        if value is None:
+            return None
+        if isinstance(value, str):
+            return self._enum_class[value.upper()].value
+        return self._enum_class(value).value
+
+    def process_result_value(self, value, dialect):
+        """Converts the stored integer back to the IntEnum member."""
+        if value is None:
+            return None
+        return self._enum_class(value)
 
 
 class User(UserMixin, db.Model):
@@ -56,6 +153,8 @@ class User(UserMixin, db.Model):
         manages (list[User]): List of users managed by this user.
         role_id (int): Foreign key to the Role model.
         role (Role): The role assigned to the user.
+        role_name (str): Denormalized copy of the role's name, kept in
+            sync whenever the role assignment changes.
         department_id (int): Foreign key to the Department model.
         department (Department): The department assigned to the user.
         module_progress (list[UserModuleProgress]): List of training module 
@@ -65,6 +164,16 @@ class User(UserMixin, db.Model):
     """
     __tablename__ = 'user'
 
+    # Composite indexes for name-ordered listings and department/role
+    # report filters, so those queries avoid a table scan plus filesort
+    __table_args__ = (
+        sa.Index('ix_user_surname_first', 'surname', 'first_name'),
+        sa.Index(
+            'ix_user_dept_role_started',
+            'department_id', 'role_id', 'dateStarted'
+        ),
+    )
+
     # Primary key
     id: so.Mapped[int] = so.mapped_column(primary_key = True)
 
@@ -79,23 +188,24 @@ class User(UserMixin, db.Model):
         index = True
     )
     surname: so.Mapped[str] = so.mapped_column(
-        sa.String(50), 
-        index = True
+        sa.String(50)
     )
     job_title: so.Mapped[str] = so.mapped_column(
         sa.String(50), 
         index = True
     )
     password_hash: so.Mapped[str] = so.mapped_column(
-        sa.String(256)
+        sa.String(256), 
+        deferred = True   # Only the auth path needs the hash; keep it
+                          # out of user listing scans
     )
     is_onboarding: so.Mapped[bool] = so.mapped_column(
         default = False   # Default: Not onboarding
     )  
     dateStarted: so.Mapped[datetime] = so.mapped_column(
+        sa.DateTime(timezone=True),
         index=True, 
-        default = lambda: 
-            datetime.now(timezone.utc)
+        server_default = sa.func.now()
     )
     google_email: so.Mapped[Optional[str]] = so.mapped_column(
         sa.String(120), 
@@ -127,9 +237,14 @@ class User(UserMixin, db.Model):
     role_id: so.Mapped[int] = so.mapped_column(
         sa.ForeignKey('role.id')
     )
-    role: so.Mapped['Role'] = so.relationship(
-        'Role', 
-        back_populates = 'users'
+    role: so.Mapped['Role'] = so.relationship('Role')
+
+    # Denormalized from Role so the per-request role checks are a plain
+    # attribute read on the already-loaded user instead of a JOIN; the
+    # event listeners below Role keep it in sync
+    role_name: so.Mapped[str] = so.mapped_column(
+        sa.String(20),
+        index = True
     )
 
     # Relationship to department
@@ -138,7 +253,7 @@ class User(UserMixin, db.Model):
     )
     department: so.Mapped['Department'] = so.relationship(
         'Department', 
-        back_populates = 'users'
+        lazy = 'joined'
     )
 
     # Relationship to module progress
@@ -152,33 +267,153 @@ class User(UserMixin, db.Model):
         nullable = True
     )
     onboarding_path: so.Mapped['OnboardingPath'] = so.relationship(
-        'OnboardingPath'
+        'OnboardingPath', 
+        lazy = 'joined'
     )
 
     def __repr__(self):
         """Returns a string representation of the User object."""
         return f'<User {self.username}>'
 
+    def team(self, session):
+        """Returns every user transitively managed by this user.
+
+        A single recursive CTE walks the manager hierarchy inside the
+        database, so team queries cost one round trip regardless of
+        depth instead of one query per management level.
+
+        Args:
+            session: The database session to query with.
+
+        Returns:
+            list[User]: All direct and indirect reports.
+        """
+        hierarchy = (
+            sa.select(User.id)
+            .where(User.manager_id == self.id)
+            .cte('team', recursive=True)
+        )
+        hierarchy = hierarchy.union_all(
+            sa.select(User.id).where(User.manager_id == hierarchy.c.id)
+        )
+        return session.execute(
+            sa.select(User).where(User.id.in_(sa.select(hierarchy.c.id)))
+        ).scalars().unique().all()
+
+    def get_id(self):
+        """Returns the session token Flask-Login stores in the cookie.
+
+        The token embeds a short digest of the password hash so that
+        sessions issued before a password change stop validating without
+        a separate lookup or forced logout sweep.
+        """
+        return f'{self.id}:{_hash_fragment(self.password_hash)}'
+
     def set_password(self, password):
         """Sets the user's password by hashing it."""
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = pwd_context.hash(password)
 
     def check_password(self, password):
-        """Verifies the user's password matched the stored hashed password."""
-        return check_password_hash(self.password_hash, password)
+        """Verifies the user's password matched the stored hashed password.
+
+        Legacy werkzeug hashes are verified with the old checker and
+        upgraded to argon2 in place on success; argon2 hashes with stale
+        cost parameters are re-hashed the same way. The upgraded hash is
+        only assigned, not committed — the login view commits once after
+        login_user so the whole login costs a single write transaction.
+        """
+        stored = self.password_hash or ''
+        if pwd_context.identify(stored):
+            ok, new_hash = pwd_context.verify_and_update(password, stored)
+            if ok and new_hash:
+                self.password_hash = new_hash
+            return ok
+        if stored and check_password_hash(stored, password):
+            self.password_hash = pwd_context.hash(password)
+            return True
+        return False
 
 
 @login.user_loader
-def load_user(id):
-    """Loads a user by their ID for Flask-Login session management.
+def load_user(token):
+    """Loads a user from the Flask-Login session token.
+
+    The token has the form '<id>:<hash digest>' (see User.get_id). The
+    digest is recomputed from the stored password hash so stale sessions
+    are rejected after a password change. Tokens from before this scheme
+    (a bare id) are still accepted.
 
     Args:
-        id (int): The unique identifier of the user.
-        
+        token (str): The session token stored in the login cookie.
+
     Returns:
-        User: The User object or None if not found.
+        User: The User object or None if not found or stale.
+    """
+    user_id, _, hash_fragment = str(token).partition(':')
+
+    # Memoize per request so repeated current_user derefs (decorators,
+    # templates, route bodies) cost at most one primary-key lookup
+    cache_key = f'_user_{user_id}'
+    user = g.get(cache_key)
+    if user is None:
+        try:
+            user = db.session.execute(
+                _USER_BY_ID_STMT, {'id': int(user_id)}
+            ).unique().scalar_one_or_none()
+        except (TypeError, ValueError):
+            return None
+        setattr(g, cache_key, user)
+    if user is None:
+        return None
+    if hash_fragment and not hmac.compare_digest(
+        _hash_fragment(user.password_hash), hash_fragment
+    ):
+        return None
+    return user
+
+
+@contextmanager
+def count_queries():
+    """Counts SQL statements issued while the block runs.
+
+    Attaches a before_cursor_execute listener to the engine and yields a
+    list that accumulates the executed statements, so callers can assert
+    a query budget for a code path and catch N+1 regressions:
+
+        with count_queries() as queries:
+            ...exercise a route or query...
+        assert len(queries) <= 3
+
+    Yields:
+        list[str]: The SQL statements executed inside the block.
     """
-    return db.session.get(User, int(id))
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sa.event.listen(db.engine, 'before_cursor_execute', _record)
+    try:
+        yield statements
+    finally:
+        sa.event.remove(db.engine, 'before_cursor_execute', _record)
+
+
+def strict_load_options():
+    """Returns loader options that forbid implicit lazy loads.
+
+    Queries whose relationship graph is fully eager-loaded can append
+    these options so that, under TESTING, any stray lazy load raises
+    immediately instead of silently issuing an N+1 query. Outside
+    testing the helper is a no-op so production never breaks on an
+    unanticipated relationship access.
+
+    Returns:
+        tuple: (raiseload('*'),) when TESTING, otherwise empty.
+    """
+    if current_app.config.get('TESTING'):
+        return (so.raiseload('*'),)
+    return ()
 
 
 class Role(db.Model):
@@ -187,7 +422,6 @@ class Role(db.Model):
     Attributes:
         id (int): Primary key.
         role_name (str): Name of the role (e.g., admin, manager, staff).
-        users (list[User]): List of users assigned to this role (relationship).
     """
     __tablename__ = 'role'
 
@@ -201,23 +435,49 @@ class Role(db.Model):
         unique = True
     )
 
-    # Relationship to User
-    users: so.Mapped[list['User']] = so.relationship(
-        'User', back_populates = 'role'
-    )
-
     def __repr__(self):
         """Returns a string representation of the Role object."""
         return f'<Role {self.role_name}>'
 
 
+# Roles are fixed reference data, so the id -> name mapping is read at
+# most once per process and then served from memory
+_ROLE_NAME_CACHE = {}
+
+
+def _role_name_for(role_id):
+    """Returns the role name for a role id, cached after first lookup."""
+    name = _ROLE_NAME_CACHE.get(role_id)
+    if name is None:
+        name = db.session.scalar(
+            sa.select(Role.role_name).where(Role.id == role_id)
+        )
+        if name is not None:
+            _ROLE_NAME_CACHE[role_id] = name
+    return name
+
+
+@sa.event.listens_for(User.role, 'set')
+def _sync_role_name(target, value, oldvalue, initiator):
+    """Mirrors the role's name onto User.role_name on assignment."""
+    target.role_name = value.role_name if value is not None else None
+
+
+@sa.event.listens_for(User.role_id, 'set')
+def _sync_role_name_from_id(target, value, oldvalue, initiator):
+    """Mirrors the role's name onto User.role_name when only the
+    foreign key is assigned (e.g. from a form's select field)."""
+    target.role_name = (
+        _role_name_for(int(value)) if value is not None else None
+    )
+
+
 class Department(db.Model):
     """Represents a department in the system.
     
     Attributes:
         id (int): Primary key.
         department_name (str): Name of the department (e.g., office, operational).
-        users (list[User]): List of users assigned to this department.
     """
     __tablename__ = 'department'
 
@@ -233,12 +493,6 @@ class Department(db.Model):
         unique = True
     )
 
-    # Relationship to User 
-    users: so.Mapped[List['User']] = so.relationship(
-        'User', 
-        back_populates = 'department'
-    )
-
     def __repr__(self):
         """Returns a string representation of the Department object."""
         return f'<Department {self.department_name}>'
@@ -254,12 +508,20 @@ class TrainingModule (db.Model):
         module_instructions (str): Instructions for completing the module.
         video_url (Optional[str]): Optional URL for video content.
         active (bool): Indicates whether the module is currently active.
+        question_count (int): Denormalized number of questions, kept in
+            sync as questions are added and removed.
         questions (list[Question]): Questions associated with the module.
         user_progress (list[UserModuleProgress]): Progress entries for users.
         onboarding_steps (List[OnboardingStep]): Steps in assigned onboarding 
             paths.
-    """ 
-    __tablename__ = 'training_module'   
+    """
+    __tablename__ = 'training_module'
+
+    # Covering index for listing queries filtering on active and ordering
+    # by title (e.g. the dashboards and admin module list)
+    __table_args__ = (
+        sa.Index('ix_training_module_active_title', 'active', 'module_title'),
+    )
 
     # Primary key
     id: so.Mapped[int] = so.mapped_column(primary_key=True)
@@ -281,10 +543,19 @@ class TrainingModule (db.Model):
         sa.Boolean, nullable=False, default=True
     )
 
-    # Relationship with questions   
+    # Denormalized number of questions, maintained by the Question
+    # events below, so the dashboards can compute pass thresholds
+    # without loading the questions collection at all
+    question_count: so.Mapped[int] = so.mapped_column(
+        sa.Integer, default=0, nullable=False
+    )
+
+    # Relationship with questions. Loaded lazily: the quiz path pulls
+    # the full graph explicitly through get_for_quiz, and everything
+    # else only needs question_count
     questions: so.Mapped[List['Question']] = so.relationship(
-        'Question', 
-        back_populates = 'training_module', 
+        'Question',
+        back_populates = 'training_module',
         cascade = 'all, delete-orphan')
 
     # Relationship with user progress
@@ -300,6 +571,30 @@ class TrainingModule (db.Model):
         cascade = 'all, delete-orphan'
         )
 
+    @classmethod
+    def get_for_quiz(cls, session, module_id):
+        """Loads a module with its questions and options for quiz rendering.
+
+        The selectinload chain fetches the module, all questions and all
+        options in three batched queries regardless of question count, so
+        no lazy loads fire while the template iterates.
+
+        Args:
+            session: The database session to query with.
+            module_id (int): The ID of the training module.
+
+        Returns:
+            TrainingModule: The module, or None if not found.
+        """
+        return session.execute(
+            sa.select(cls)
+            .where(cls.id == module_id)
+            .options(
+                so.selectinload(cls.questions).selectinload(Question.options),
+                *strict_load_options()
+            )
+        ).scalar_one_or_none()
+
     def __repr__(self):
         """Returns a string representation of the TrainingModule object."""
         return f'<TrainingModule {self.module_title}>'
@@ -339,7 +634,8 @@ class Question (db.Model):
     options: so.Mapped[List['Option']] = so.relationship(
         'Option', 
         back_populates = 'question', 
-        cascade='all, delete-orphan'
+        cascade='all, delete-orphan', 
+        lazy = 'selectin'
     )
 
     def __repr__(self):
@@ -347,6 +643,26 @@ class Question (db.Model):
         return f'<Question {self.question_text}>'
 
 
+@sa.event.listens_for(Question, 'after_insert')
+def _question_added(mapper, connection, target):
+    """Keeps TrainingModule.question_count in step on insert."""
+    connection.execute(
+        sa.update(TrainingModule)
+        .where(TrainingModule.id == target.training_module_id)
+        .values(question_count = TrainingModule.question_count + 1)
+    )
+
+
+@sa.event.listens_for(Question, 'after_delete')
+def _question_removed(mapper, connection, target):
+    """Keeps TrainingModule.question_count in step on delete."""
+    connection.execute(
+        sa.update(TrainingModule)
+        .where(TrainingModule.id == target.training_module_id)
+        .values(question_count = TrainingModule.question_count - 1)
+    )
+
+
 class Option (db.Model):
     """Represents answer options for a question.
 
@@ -398,6 +714,9 @@ class UserModuleProgress (db.Model):
         completed_date (datetime, optional): When the module was completed.
         score (int, optional): The score achieved by the user in the module.
         attempts (int): Number of attempts made by the user.
+        correct_count (int): Denormalized count of correct answers for the
+            attempt.
+        total_count (int): Denormalized count of questions answered against.
         user_id (int): Foreign key to the User model.
         user (User): The user associated with this progress entry.
         training_module_id (int): Foreign key to the TrainingModule model.
@@ -407,17 +726,44 @@ class UserModuleProgress (db.Model):
     """
     __tablename__ = 'user_module_progress'
 
+    # Rows are deleted in bulk during retakes; skip the per-row
+    # rowcount verification on flush
+    __mapper_args__ = {'confirm_deleted_rows': False}
+
+    # Composite indexes: latest-attempt lookups per (user, module) and
+    # per-module completion reporting
+    __table_args__ = (
+        sa.Index(
+            'ix_ump_user_module_latest',
+            'user_id', 'training_module_id', sa.desc('id')
+        ),
+        sa.Index(
+            'ix_ump_module_completed',
+            'training_module_id', 'completed_date'
+        ),
+        # At most one open attempt per (user, module), so the quiz GET
+        # can create a fresh attempt with a single race-safe
+        # INSERT ... ON CONFLICT DO NOTHING
+        sa.Index(
+            'uq_ump_open_attempt',
+            'user_id', 'training_module_id',
+            unique=True,
+            sqlite_where=sa.text('completed_date IS NULL'),
+            postgresql_where=sa.text('completed_date IS NULL'),
+        ),
+    )
+
     # Primary key
     id: so.Mapped[int] = so.mapped_column(primary_key=True) 
 
     # User Module Progress details
     start_date: so.Mapped[datetime] = so.mapped_column(
-        sa.DateTime, 
-        default = lambda: datetime.now(timezone.utc), 
+        sa.DateTime(timezone=True), 
+        server_default = sa.func.now(), 
         nullable = False
     )
     completed_date: so.Mapped[datetime] = so.mapped_column(
-        sa.DateTime, 
+        sa.DateTime(timezone=True), 
         nullable = True
     )
     score: so.Mapped[int] = so.mapped_column(
@@ -425,8 +771,21 @@ class UserModuleProgress (db.Model):
         nullable = True
     )
     attempts: so.Mapped[int] = so.mapped_column(
-        sa.Integer, 
-        default=0, 
+        sa.Integer,
+        default=0,
+        nullable = False
+    )
+
+    # Denormalized answer tallies, maintained when an attempt is
+    # submitted so dashboards and reports never re-count answer rows
+    correct_count: so.Mapped[int] = so.mapped_column(
+        sa.Integer,
+        default = 0,
+        nullable = False
+    )
+    total_count: so.Mapped[int] = so.mapped_column(
+        sa.Integer,
+        default = 0,
         nullable = False
     )
 
@@ -440,6 +799,34 @@ class UserModuleProgress (db.Model):
         back_populates = 'module_progress'
     )
 
+    @classmethod
+    def record_attempt(cls, session, progress_id, score, correct, total):
+        """Finalizes an attempt with a single atomic UPDATE.
+
+        Bumps the attempt counter and writes the score, answer tallies
+        and completion timestamp in one statement, instead of mutating a
+        loaded row and flushing attribute by attribute.
+
+        Args:
+            session: The database session to execute with.
+            progress_id (int): ID of the progress row to finalize.
+            score (int): Final score for the attempt.
+            correct (int): Number of correct answers.
+            total (int): Number of questions in the module.
+        """
+        session.execute(
+            sa.update(cls)
+            .where(cls.id == progress_id)
+            .values(
+                attempts = cls.attempts + 1,
+                score = score,
+                correct_count = correct,
+                total_count = total,
+                completed_date = sa.func.now()
+            )
+            .execution_options(synchronize_session = False)
+        )
+
     # Relationship to Training Module
     training_module_id: so.Mapped[int] = so.mapped_column(
         sa.ForeignKey('training_module.id'), 
@@ -454,7 +841,8 @@ class UserModuleProgress (db.Model):
     answers: so.Mapped[List['UserQuestionAnswer']] = so.relationship(
         'UserQuestionAnswer', 
         back_populates = 'progress', 
-        cascade = 'all, delete-orphan'
+        cascade = 'all, delete-orphan', 
+        lazy = 'selectin'
     )
 
 
@@ -474,7 +862,16 @@ class UserQuestionAnswer (db.Model):
             Option (if any).
     """
     __tablename__ = 'user_question_answer'
-    
+
+    # Answer rows are rewritten wholesale on resubmission; skip the
+    # per-row rowcount verification on flush
+    __mapper_args__ = {'confirm_deleted_rows': False}
+
+    # Lets correct-answer counts per attempt run as an index-only scan
+    __table_args__ = (
+        sa.Index('ix_uqa_progress_correct', 'progress_id', 'is_correct'),
+    )
+
     # Primary key
     id: so.Mapped[int] = so.mapped_column(primary_key=True)
     is_correct: so.Mapped[bool] = so.mapped_column(sa.Boolean)
@@ -506,6 +903,90 @@ class UserQuestionAnswer (db.Model):
     selected_option: so.Mapped['Option'] = so.relationship('Option')
 
 
+class ModuleCompletionStats(db.Model):
+    """Per-module completion summary used by report endpoints.
+
+    One row per training module holding pre-aggregated completion
+    figures, so reports read a primary-key row instead of aggregating
+    over every progress and answer row at request time. Rows are
+    refreshed via refresh() after quiz submissions.
+
+    Attributes:
+        module_id (int): Primary key; foreign key to TrainingModule.
+        total_users (int): Users with at least one attempt at the module.
+        completed_users (int): Users with a completed attempt.
+        avg_score (float, optional): Average score across completed attempts.
+        refreshed_at (datetime): When this row was last recomputed.
+    """
+    __tablename__ = 'module_completion_stats'
+
+    # Primary key
+    module_id: so.Mapped[int] = so.mapped_column(
+        sa.ForeignKey('training_module.id'), 
+        primary_key = True
+    )
+
+    # Aggregated figures
+    total_users: so.Mapped[int] = so.mapped_column(
+        sa.Integer, 
+        default = 0, 
+        nullable = False
+    )
+    completed_users: so.Mapped[int] = so.mapped_column(
+        sa.Integer, 
+        default = 0, 
+        nullable = False
+    )
+    avg_score: so.Mapped[Optional[float]] = so.mapped_column(
+        sa.Float, 
+        nullable = True
+    )
+    refreshed_at: so.Mapped[datetime] = so.mapped_column(
+        sa.DateTime(timezone=True), 
+        default = lambda: datetime.now(timezone.utc), 
+        nullable = False
+    )
+
+    @classmethod
+    def refresh(cls, session, module_id = None):
+        """Recomputes summary rows from UserModuleProgress.
+
+        Args:
+            session: The database session to work in.
+            module_id (int, optional): Restrict the refresh to one module;
+                refreshes every module when omitted.
+        """
+        stmt = sa.select(
+            UserModuleProgress.training_module_id,
+            sa.func.count(sa.distinct(UserModuleProgress.user_id)),
+            sa.func.count(sa.distinct(
+                sa.case(
+                    (UserModuleProgress.completed_date.isnot(None),
+                     UserModuleProgress.user_id)
+                )
+            )),
+            sa.func.avg(UserModuleProgress.score),
+        ).group_by(UserModuleProgress.training_module_id)
+        if module_id is not None:
+            stmt = stmt.where(
+                UserModuleProgress.training_module_id == module_id
+            )
+
+        now = datetime.now(timezone.utc)
+        for mid, total, completed, avg in session.execute(stmt):
+            session.merge(cls(
+                module_id = mid,
+                total_users = total,
+                completed_users = completed,
+                avg_score = avg,
+                refreshed_at = now
+            ))
+
+    def __repr__(self):
+        """Returns a string representation of the stats object."""
+        return f'<ModuleCompletionStats module={self.module_id}>'
+
+
 class OnboardingPath(db.Model):
     """Represents an onboarding path defining a sequence of steps for staff.
 
@@ -531,7 +1012,8 @@ class OnboardingPath(db.Model):
     steps: so.Mapped[List['OnboardingStep']] = so.relationship(
         'OnboardingStep', 
         back_populates='path', 
-        cascade='all, delete-orphan'
+        cascade='all, delete-orphan', 
+        lazy='selectin'
     )
 
     def __repr__(self):
@@ -579,8 +1061,10 @@ class OnboardingStep(db.Model):
         nullable = True
     )
     training_module: so.Mapped['TrainingModule'] = so.relationship(
-        'TrainingModule', 
-        back_populates = 'onboarding_steps'
+        'TrainingModule',
+        back_populates = 'onboarding_steps',
+        lazy = 'selectin'   # Steps are only ever read alongside their
+                            # module; one IN query loads all of them
     )
 
     def __repr__(self):
@@ -594,8 +1078,7 @@ class DocumentRepository(db.Model):
     Attributes:
         id (int): Primary key.
         document_title (str): Title of the document.
-        document_category (str): Category of the document (e.g., Policy, Guide, 
-            Form).
+        document_category (DocumentCategory): Category of the document.
         upload_date (datetime): Timestamp when uploaded.
         file_path (str):  Filesystem path to the uploaded file.
         user_id (int): Foreign key to the uploaders User model.
@@ -611,14 +1094,13 @@ class DocumentRepository(db.Model):
         sa.String(150), 
         nullable = False
     )
-    document_category: so.Mapped[str] = so.mapped_column(
-        sa.Enum('Policy', 'Guide', 'Form', 
-        name = 'document_category'), 
+    document_category: so.Mapped[DocumentCategory] = so.mapped_column(
+        IntEnumType(DocumentCategory), 
         nullable = False
     )
     upload_date: so.Mapped[datetime] = so.mapped_column(
-        sa.DateTime, 
-        default=lambda: datetime.now(timezone.utc), 
+        sa.DateTime(timezone=True), 
+        server_default=sa.func.now(), 
         nullable = False
     )
     file_path: so.Mapped[str] = so.mapped_column(
@@ -643,34 +1125,51 @@ class Report(db.Model):
     
     Attributes:
         id (int): Primary key.
-        report_type (str): Type of report (e.g., Completion, Performance).
+        report_type (ReportType): Type of report.
         description (str): Short description of the report.
-        report_data (str, optional): Stored Json report content.
+        report_data (dict, optional): Stored JSON report content.
         created_at (datetime): Timestamp when the report was created.
     """
     __tablename__ = 'report'
 
+    # GIN index so Postgres can filter inside report_data server-side
+    __table_args__ = (
+        sa.Index('ix_report_data_gin', 'report_data', postgresql_using='gin'),
+    )
+
     # Primary key
     id: so.Mapped[int] = so.mapped_column(primary_key=True)
 
     # Report details
-    report_type: so.Mapped[str] = so.mapped_column(
-        sa.Enum('Completion', 'Performance', name = 'report_type'), 
+    report_type: so.Mapped[ReportType] = so.mapped_column(
+        IntEnumType(ReportType), 
         nullable = False
     )
     description: so.Mapped[str] = so.mapped_column(
         sa.String(255), 
         nullable = False
         )    
-    report_data: so.Mapped[Optional[str]] = so.mapped_column(
-        sa.Text, 
-        nullable = True)  
+    report_data: so.Mapped[Optional[dict]] = so.mapped_column(
+        sa.JSON().with_variant(JSONB(), 'postgresql'),
+        nullable = True)
     created_at: so.Mapped[datetime] = so.mapped_column(
-        sa.DateTime, 
-        default = lambda: datetime.now(timezone.utc), 
+        sa.DateTime(timezone=True), 
+        server_default = sa.func.now(), 
         nullable = False
     )
 
     def __repr__(self):
         """Returns a string representation of the Report object."""
-        return f"<Report {self.report_type} created on {self.created_at}>"
\ No newline at end of file
+        return f"<Report {self.report_type} created on {self.created_at}>"
+
+
+# Built once at import time (after all mappers are defined) so the auth
+# hot path always hits the engine's compiled-statement cache instead of
+# re-compiling the SELECT
+_USER_BY_ID_STMT = (
+    sa.select(User)
+    .where(User.id == sa.bindparam('id'))
+    # get_id embeds a digest of the hash in the session token, so the
+    # auth path loads the deferred hash up front
+    .options(so.undefer(User.password_hash))
+)
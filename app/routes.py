@@ -7,18 +7,26 @@
 This file handles user login/logout, dashboard rendering for staff and 
 manager roles, staff training workflows, and profile photo upload.
 """
+import io
 import os
 import secrets
-from datetime import datetime, timezone
+import shutil
+from functools import lru_cache, wraps
 from urllib.parse import urlsplit
 
 import sqlalchemy as sa
+import sqlalchemy.orm as so
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from flask import (
-    render_template, 
-    flash, redirect, 
-    url_for, 
-    request, 
-    current_app
+    render_template,
+    stream_template,
+    flash, redirect,
+    url_for,
+    request,
+    current_app,
+    abort,
+    make_response
 )
 from flask_login import (
     current_user, 
@@ -26,19 +34,184 @@ from flask_login import (
     logout_user, 
     login_required
 )
-from werkzeug.utils import secure_filename
-
 from app.forms import LoginForm
-from app import app, db
+from app import app, db, cache
 from app.models import (
-    User, 
-    TrainingModule, 
-    UserModuleProgress, 
-    Option, 
-    UserQuestionAnswer
+    pwd_context,
+    User,
+    TrainingModule,
+    UserModuleProgress,
+    Option,
+    UserQuestionAnswer,
+    ModuleCompletionStats,
+    strict_load_options
 )
 from config import Config
 
+# Extensions accepted for profile photo uploads, hashed once at import
+# time so the per-request check is a single frozenset membership test
+ALLOWED_PHOTO_EXTS = frozenset(
+    '.' + ext for ext in Config.ALLOWED_EXTENSIONS
+)
+
+# Maps each role to its landing endpoint; unknown roles fall through to
+# logout. A single dict lookup replaces the duplicated if/elif chains
+# that used to run on every login request.
+ROLE_ENDPOINTS = {
+    'admin': 'admin_dashboard',
+    'manager': 'manager_dashboard',
+    'staff': 'staff_dashboard',
+}
+
+
+@lru_cache(maxsize=8)
+def _dashboard_url_for_role(role_name):
+    """Returns the dashboard URL for a role, built once per process.
+
+    The dashboard endpoints take no parameters, so the URL produced by
+    url_for never changes; caching it skips the URL-map walk that
+    url_for performs on every call. Must be first called inside a
+    request context.
+    """
+    return url_for(ROLE_ENDPOINTS.get(role_name, 'logout'))
+
+
+def _redirect_for(user):
+    """Redirects a user to the dashboard matching their role."""
+    return redirect(_dashboard_url_for_role(user.role_name))
+
+
+def role_required(*roles):
+    """Restricts a view to users whose role is in `roles`.
+
+    Subsumes login_required: anonymous users go through the normal
+    Flask-Login unauthorized handling, while authenticated users with
+    the wrong role get a 403 straight away — one set-membership check
+    against the denormalized role_name instead of a per-view guard and
+    redirect round trip.
+    """
+    roles = frozenset(roles)
+
+    def decorator(view):
+        @wraps(view)
+        def wrapped(*args, **kwargs):
+            if not current_user.is_authenticated:
+                return app.login_manager.unauthorized()
+            if current_user.role_name not in roles:
+                abort(403)
+            return view(*args, **kwargs)
+        return wrapped
+    return decorator
+
+
+def _write_profile_photo(src, save_path, old_path):
+    """Writes an uploaded profile photo to disk off the request thread.
+
+    Runs on the app executor: the request only reads the upload and
+    commits the database row, while the file write and removal of the
+    replaced photo happen here. The copy uses 1 MiB chunks instead of
+    Werkzeug's default 16 KiB, so a multi-megabyte photo costs a
+    handful of write syscalls rather than hundreds. A failed write is
+    logged rather than silently discarded with the future.
+
+    Args:
+        src (io.BytesIO): Buffer holding the uploaded image contents.
+        save_path (str): Destination path for the new photo.
+        old_path (str | None): Path of the photo being replaced, if any.
+    """
+    try:
+        with open(save_path, 'wb') as dst:
+            shutil.copyfileobj(src, dst, length=1024 * 1024)
+    except Exception:
+        # The profile_photo row is already committed, so a failed write
+        # (disk full, permissions) must not vanish with the future
+        app.logger.exception('Profile photo write failed for %s', save_path)
+        return
+    if old_path:
+        # EAFP: deleting straight away saves the stat syscall of an
+        # exists() check and is race-free if the file is already gone
+        try:
+            os.remove(old_path)
+        except FileNotFoundError:
+            pass
+
+
+def _refresh_module_stats(module_id):
+    """Recomputes a module's completion summary off the request thread.
+
+    The summary table only feeds reports, so the refresh runs on the
+    app executor after the user-facing writes have committed, inside
+    its own app context and session.
+
+    Args:
+        module_id (int): ID of the training module to refresh.
+    """
+    with app.app_context():
+        try:
+            ModuleCompletionStats.refresh(db.session, module_id)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            app.logger.exception(
+                'Completion stats refresh failed for module %s', module_id
+            )
+        finally:
+            db.session.remove()
+
+
+def _conditional(body):
+    """Wraps a rendered page in an ETag-bearing conditional response.
+
+    Repeat visits (tab switches, back navigation) revalidate with
+    If-None-Match and get an empty 304 instead of the full body when
+    nothing changed. Cache-Control stays private/no-cache so shared
+    caches never store the page and browsers always revalidate.
+    """
+    response = make_response(body)
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    response.add_etag()
+    return response.make_conditional(request)
+
+
+def _latest_progress_by_module(user_id, module_ids):
+    """Returns the newest UserModuleProgress per module for a user.
+
+    Fetches every attempt for the given modules in one IN query ordered
+    by (module, id desc); the first row seen per module is the latest
+    attempt. Replaces the per-module query-in-a-loop pattern on the
+    dashboards.
+
+    Args:
+        user_id (int): ID of the user whose progress is wanted.
+        module_ids (list[int]): Training module IDs to look up.
+
+    Returns:
+        dict[int, UserModuleProgress]: Latest attempt keyed by module ID.
+    """
+    if not module_ids:
+        return {}
+    latest = {}
+    rows = db.session.scalars(
+        sa.select(UserModuleProgress)
+        .where(
+            UserModuleProgress.user_id == user_id,
+            UserModuleProgress.training_module_id.in_(module_ids)
+        )
+        .order_by(
+            UserModuleProgress.training_module_id,
+            UserModuleProgress.id.desc()
+        )
+        # The dashboards only read column attributes off these rows, so
+        # under TESTING any stray relationship access raises instead of
+        # issuing a hidden per-row SELECT
+        .options(*strict_load_options())
+    )
+    for progress in rows:
+        latest.setdefault(progress.training_module_id, progress)
+    return latest
+
+
 @app.route('/login', methods=['GET', 'POST'])
 def login():      
     """Authenticate a user and redirect to role-specific dashboard.
@@ -51,46 +224,45 @@ def login():
         - Rendered login template on GET or invalid credentials.
         - Redirect to admin, manager, or staff dashboard on successful login.
     """
-    if current_user.is_authenticated:
-        if current_user.role.role_name == "admin":
-            return redirect(url_for('admin_dashboard'))
-        elif current_user.role.role_name == "manager":
-            return redirect(url_for('manager_dashboard'))
-        elif current_user.role.role_name == "staff":
-            return redirect(url_for('staff_dashboard'))
-        else:
-            return redirect(url_for('logout'))
-    
-    form = LoginForm()
-    if form.validate_on_submit():
+    # Both the already-authenticated and freshly-authenticated cases
+    # fall through to the single role redirect at the end
+    if not current_user.is_authenticated:
+        form = LoginForm()
+        if not form.validate_on_submit():
+            return render_template(
+                'login.html',
+                title='Sign In',
+                form=form
+            )
+
         user = db.session.scalar(
-            sa.select(User).where(User.username == form.username.data)
+            sa.select(User)
+            .where(User.username == form.username.data)
+            .options(so.undefer(User.password_hash))
         )
-        
+
+        if user is None:
+            # Burn a dummy verification so an unknown username costs
+            # the same time as a wrong password and does not leak
+            # account existence through response timing
+            pwd_context.dummy_verify()
         if user is None or not user.check_password(form.password.data):
             flash('Invalid username or password')
             return redirect(url_for('login'))
-        
+
         login_user(user, remember=form.remember_me.data)
 
+        # check_password may have left an upgraded hash pending; commit
+        # it here so verification and login share one write transaction
+        # instead of committing mid-verification
+        if db.session.dirty:
+            db.session.commit()
+
         next_page = request.args.get('next')
-        if next_page and urlsplit(next_page).netloc == '':                
+        if next_page and urlsplit(next_page).netloc == '':
             return redirect(next_page)
-        
-        if user.role.role_name == "admin":
-            return redirect(url_for('admin_dashboard'))            
-        elif user.role.role_name == "manager":
-            return redirect(url_for('manager_dashboard'))
-        elif user.role.role_name == "staff":
-            return redirect(url_for('staff_dashboard'))
-        else:
-            return redirect(url_for('logout'))
 
-    return render_template(
-        'login.html', 
-        title='Sign In', 
-        form=form
-    )
+    return _redirect_for(current_user)
 
 
 @app.route('/')
@@ -107,11 +279,8 @@ def logout():
 
 
 @app.route('/dashboard_staff')
-@login_required
+@role_required('staff')
 def staff_dashboard():
-    if current_user.role.role_name != "staff":
-        return redirect(url_for('login'))
-
     manager = current_user.manager
 
     steps = (
@@ -129,60 +298,58 @@ def staff_dashboard():
     passing_threshold = 0.5
     to_do_list = []
 
+    latest_progress = _latest_progress_by_module(
+        current_user.id, [module.id for module in active_modules]
+    )
+
     for module in active_modules:
-        progress = UserModuleProgress.query.filter_by(
-            user_id=current_user.id,
-            training_module_id=module.id
-        ).order_by(UserModuleProgress.id.desc()).first()
+        progress = latest_progress.get(module.id)
 
         if (
             progress is None
             or progress.completed_date is None
             or (
                 progress.score is not None
-                and (progress.score / max(len(module.questions), 1)) < passing_threshold
+                and (progress.score / max(module.question_count, 1)) < passing_threshold
             )
         ):
             to_do_list.append(module)
 
-    return render_template(
+    return _conditional(render_template(
         'dashboard_staff.html',
         title='Staff Dashboard',
         to_do_list=to_do_list,
         manager=manager
-    )
+    ))
 
 
 @app.route('/dashboard_manager')
-@login_required
+@role_required('manager')
 def manager_dashboard():
-    """Render the manager dashboard if user is a manager."""
-    if current_user.role.role_name != "manager":
-        return redirect(url_for('login'))
-    
-    return render_template(
-        '/dashboard_manager.html', 
+    """Render the manager dashboard."""
+    return _conditional(render_template(
+        '/dashboard_manager.html',
         title='Manager Dashboard'
-    )
+    ))
 
 
-@app.route('/dashboard_training', methods = ['GET'])
-@login_required
-def training_dashboard():
-    """Display training modules for staff users.
+@cache.memoize(timeout=60)
+def _training_dashboard_lists(user_id):
+    """Assembles the training dashboard lists for a user.
 
-    Renders a dashboard showing training modules that are either completed,
-    in progress, or yet to be started by the staff user.
+    Memoized per user for up to a minute and invalidated whenever the
+    user starts, saves or submits an attempt, so rapid dashboard
+    revisits skip the progress queries entirely.
+
+    Args:
+        user_id (int): ID of the staff user.
 
     Returns:
-        - Redirect to logout if the current user isn't staff.
-        - Rendered “dashboard_training.html” with three lists:
-            `to_be_completed_modules`, `in_progress_modules`, and `completed_modules`.
+        tuple: (to_be_completed_modules, in_progress_modules,
+        completed_modules) as consumed by the template.
     """
-    if current_user.role.role_name != "staff":
-        return redirect(url_for('logout'))
-
-    onboarding_path = current_user.onboarding_path
+    user = db.session.get(User, user_id)
+    onboarding_path = user.onboarding_path
     steps = onboarding_path.steps if onboarding_path else []
     active_modules = [
         step.training_module for step in steps if step.training_module.active
@@ -193,16 +360,17 @@ def training_dashboard():
     in_progress_modules = []
     passing_threshold = 0.5
 
+    latest_progress = _latest_progress_by_module(
+        user_id, [module.id for module in active_modules]
+    )
+
     for module in active_modules:
-        progress = UserModuleProgress.query.filter_by(
-            user_id=current_user.id,
-            training_module_id=module.id
-        ).order_by(UserModuleProgress.id.desc()).first()
+        progress = latest_progress.get(module.id)
 
         if not progress:
             to_be_completed_modules.append(module)
         else:
-            total_questions = len(module.questions) or 1 
+            total_questions = module.question_count or 1
             if progress.completed_date:
                 if (progress.score is not None
                         and (progress.score / total_questions) >= passing_threshold):
@@ -216,6 +384,25 @@ def training_dashboard():
             else:
                 in_progress_modules.append(module)
 
+    return to_be_completed_modules, in_progress_modules, completed_modules
+
+
+@app.route('/dashboard_training', methods = ['GET'])
+@role_required('staff')
+def training_dashboard():
+    """Display training modules for staff users.
+
+    Renders a dashboard showing training modules that are either completed,
+    in progress, or yet to be started by the staff user.
+
+    Returns:
+        - Rendered “dashboard_training.html” with three lists:
+            `to_be_completed_modules`, `in_progress_modules`, and `completed_modules`.
+    """
+    to_be_completed_modules, in_progress_modules, completed_modules = (
+        _training_dashboard_lists(current_user.id)
+    )
+
     return render_template(
         'dashboard_training.html', 
         title="Training Dashboard", 
@@ -225,8 +412,49 @@ def training_dashboard():
     )
 
 
+def _start_attempt(module_id):
+    """Creates a fresh open attempt for the current user, race-safely.
+
+    Issues a single INSERT ... ON CONFLICT DO NOTHING keyed on the
+    partial unique index over open attempts, so two tabs opening the
+    same quiz concurrently cannot create duplicate in-progress rows;
+    the insert that loses the race simply adopts the surviving row.
+
+    Args:
+        module_id (int): Training module the attempt belongs to.
+
+    Returns:
+        UserModuleProgress: The open attempt for the current user and
+        module. start_date comes from the column's server default, so
+        every attempt is stamped by the database clock.
+    """
+    insert = (
+        pg_insert if db.engine.dialect.name == 'postgresql'
+        else sqlite_insert
+    )
+    db.session.execute(
+        insert(UserModuleProgress)
+        .values(user_id=current_user.id, training_module_id=module_id)
+        .on_conflict_do_nothing(
+            index_elements=['user_id', 'training_module_id'],
+            index_where=UserModuleProgress.completed_date.is_(None),
+        )
+    )
+    db.session.commit()
+    return db.session.scalars(
+        sa.select(UserModuleProgress)
+        .where(
+            UserModuleProgress.user_id == current_user.id,
+            UserModuleProgress.training_module_id == module_id,
+            UserModuleProgress.completed_date.is_(None)
+        )
+        .order_by(UserModuleProgress.id.desc())
+        .limit(1)
+    ).first()
+
+
 @app.route('/staff/take_training_module/<int:module_id>', methods = ['GET', 'POST'])
-@login_required
+@role_required('staff')
 def take_training_module(module_id):
     """Handles the staff users training module session.
 
@@ -245,44 +473,39 @@ def take_training_module(module_id):
         module_id (int): The ID of the training module to be taken.
    
     Returns:
-        - Redirects to logout if the user is not in staff role.
         - Renders 'take_training_module.html' with the module and any of the
             users previous answers.
         - Redirects to the training dashboard after saving or submitting 
             answers.
     """
-    if current_user.role.role_name != 'staff':
-        return redirect(url_for('logout'))
-    
-    module = TrainingModule.query.get_or_404(module_id)
+    module = TrainingModule.get_for_quiz(db.session, module_id)
+    if module is None:
+        abort(404)
     passing_threshold = 0.5
 
-    progress = UserModuleProgress.query.filter_by(
-        user_id=current_user.id,
-        training_module_id=module_id
-    ).order_by(UserModuleProgress.id.desc()).first()
+    progress = db.session.scalars(
+        sa.select(UserModuleProgress)
+        .where(
+            UserModuleProgress.user_id == current_user.id,
+            UserModuleProgress.training_module_id == module_id
+        )
+        .order_by(UserModuleProgress.id.desc())
+        .limit(1)
+    ).first()
 
     if request.method == 'GET':
-        if progress:
+        needs_new_attempt = progress is None
+        if progress and progress.completed_date:
             total_questions = len(module.questions) or 1
-            if progress.completed_date:
-                if (progress.score is not None
-                        and (progress.score / total_questions) < passing_threshold):
-                    progress = UserModuleProgress(
-                        user_id=current_user.id,
-                        training_module_id=module_id,
-                        start_date=datetime.now(timezone.utc)
-                    )
-                    db.session.add(progress)
-                    db.session.commit()
-        else:
-            progress = UserModuleProgress(
-                user_id=current_user.id,
-                training_module_id=module_id,
-                start_date=datetime.now(timezone.utc)
+            needs_new_attempt = (
+                progress.score is not None
+                and (progress.score / total_questions) < passing_threshold
+            )
+        if needs_new_attempt:
+            progress = _start_attempt(module_id)
+            cache.delete_memoized(
+                _training_dashboard_lists, current_user.id
             )
-            db.session.add(progress)
-            db.session.commit()
 
     if request.method == 'POST':
         action = request.form.get('action', 'submit')
@@ -290,48 +513,130 @@ def take_training_module(module_id):
         if not progress:
             progress = UserModuleProgress(
                 user_id = current_user.id,
-                training_module_id = module_id,
-                start_date = datetime.now(timezone.utc)
+                training_module_id = module_id
             )
             db.session.add(progress)
             db.session.flush()
 
-        existing_answers = {ans.question_id: ans for ans in progress.answers}
+        # The whole grading pass is read-only against the session, so
+        # suspend autoflush: the queries below must not each trigger a
+        # flush of the pending progress row — everything goes out in
+        # the bulk statements and the single commit at the end
+        with db.session.no_autoflush:
+            # Only (answer id, correctness) per question is needed to
+            # decide between update and insert and to tally the score,
+            # so fetch bare tuples rather than hydrating every answer
+            # as a full ORM object
+            existing_answers = {
+                row.question_id: row
+                for row in db.session.execute(
+                    sa.select(
+                        UserQuestionAnswer.question_id,
+                        UserQuestionAnswer.id,
+                        UserQuestionAnswer.is_correct
+                    )
+                    .where(UserQuestionAnswer.progress_id == progress.id)
+                )
+            }
+
+            # Read the submitted options in one pass over the posted
+            # form instead of a formatted-key MultiDict lookup per
+            # question, keeping only keys that belong to this module,
+            # then fetch every referenced option with a single IN query
+            # instead of one Option lookup per answer
+            posted = {}
+            for key, raw in request.form.items():
+                _, _, qid = key.partition('question_')
+                if qid.isdigit():
+                    posted[int(qid)] = int(raw) if raw.isdigit() else None
+            submitted = {
+                question.id: posted.get(question.id)
+                for question in module.questions
+            }
+
+            option_ids = [oid for oid in submitted.values() if oid]
+            options_by_id = {}
+            if option_ids:
+                options_by_id = {
+                    option.id: option
+                    for option in db.session.scalars(
+                        sa.select(Option).where(
+                            Option.id.in_(option_ids),
+                            Option.question_id.in_(submitted.keys())
+                        )
+                    )
+                }
+
+        # Collect per-row changes, then write them as two executemany
+        # statements (UPDATE by primary key, bulk INSERT) instead of
+        # flushing one statement per answer. Correctness is tallied
+        # here as each answer is graded, so the final score needs no
+        # follow-up query
+        update_rows = []
+        new_rows = []
+        correct_answers = 0
 
         for question in module.questions:
-            selected_option_id = request.form.get(f'question_{question.id}')
+            selected_option_id = submitted[question.id]
+            existing = existing_answers.get(question.id)
             if selected_option_id:
-                selected_option = Option.query.get(selected_option_id)
+                selected_option = options_by_id.get(selected_option_id)
                 is_correct = selected_option.is_correct if selected_option else False
+                option_id = selected_option.id if selected_option else None
 
-                if question.id in existing_answers:
-                    existing_answers[question.id].selected_option = selected_option
-                    existing_answers[question.id].is_correct = is_correct
+                if existing is not None:
+                    update_rows.append({
+                        'id': existing.id,
+                        'selected_option_id': option_id,
+                        'is_correct': is_correct,
+                    })
                 else:
-                    new_answer = UserQuestionAnswer(
-                        progress = progress, 
-                        question = question, 
-                        selected_option = selected_option, 
-                        is_correct = is_correct
-                    )
-                    db.session.add(new_answer)
+                    new_rows.append({
+                        'progress_id': progress.id,
+                        'question_id': question.id,
+                        'selected_option_id': option_id,
+                        'is_correct': is_correct,
+                    })
+            else:
+                # Question left blank this time round: the previously
+                # saved answer, if any, still counts
+                is_correct = bool(existing.is_correct) if existing else False
+
+            correct_answers += int(bool(is_correct))
+
+        if update_rows:
+            db.session.execute(sa.update(UserQuestionAnswer), update_rows)
+        if new_rows:
+            db.session.execute(sa.insert(UserQuestionAnswer), new_rows)
 
         if action == "save":
             db.session.commit()
+            cache.delete_memoized(_training_dashboard_lists, current_user.id)
             flash("Your progress has been saved")
             return redirect(url_for('training_dashboard'))
         else:
-            correct_answers = sum(1 for ans in progress.answers if ans.is_correct)
             total_questions = len(module.questions)
-            progress.score = correct_answers
-            progress.completed_date = datetime.now(timezone.utc)
+            UserModuleProgress.record_attempt(
+                db.session,
+                progress.id,
+                score=correct_answers,
+                correct=correct_answers,
+                total=total_questions
+            )
 
             if (correct_answers / total_questions) >= passing_threshold:
                 flash("Module completed! You passed.")
             else:
                 flash("Module failed, please retake module.")
-            
-            db.session.commit() 
+
+            db.session.commit()
+            cache.delete_memoized(_training_dashboard_lists, current_user.id)
+
+            # Keep the per-module summary row current for reports;
+            # deferrable, so it runs in the background once the
+            # user-facing writes are committed
+            current_app.executor.submit(_refresh_module_stats, module_id)
+
             return redirect(url_for('training_dashboard'))
 
     user_answers = {}
@@ -339,7 +644,10 @@ def take_training_module(module_id):
         for ans in progress.answers:
             user_answers[ans.question_id] = ans.selected_option_id
 
-    return render_template(
+    # Stream the quiz page: the browser starts receiving the form while
+    # Jinja is still iterating the question list, instead of waiting
+    # for the whole page to be buffered
+    return stream_template(
         'take_training_module.html',
         module=module,
         title=module.module_title,
@@ -370,28 +678,35 @@ def update_profile_photo():
     if not photo or photo.filename == '':
         return redirect(request.form.get('next'))
 
-    if not current_app.config['ALLOWED_EXTENSIONS'] or \
-       not Config.allowed_file(photo.filename):
+    # Whitelist check is a frozenset lookup; bad uploads are rejected
+    # before any filename sanitisation or file work happens
+    ext = os.path.splitext(photo.filename)[1].lower()
+    if ext not in ALLOWED_PHOTO_EXTS:
         return redirect(request.form.get('next'))
 
     rand = secrets.token_hex(8)
-    _, ext = os.path.splitext(secure_filename(photo.filename))
-    filename = rand + ext.lower()
+    filename = rand + ext
 
     old = current_user.profile_photo or ''
+    old_path = None
     if old != 'profileDefault.png':
         old_path = os.path.join(
-            current_app.config['PROFILE_PHOTO_FOLDER'], 
+            current_app.config['PROFILE_PHOTO_FOLDER'],
             old
         )
-        if os.path.exists(old_path):
-            os.remove(old_path)
 
     save_path = os.path.join(
-        current_app.config['PROFILE_PHOTO_FOLDER'], 
+        current_app.config['PROFILE_PHOTO_FOLDER'],
         filename
     )
-    photo.save(save_path)
+
+    # Read the upload while the request body is still available, then
+    # hand the disk write and stale-file cleanup to the background
+    # executor so the worker isn't blocked on filesystem I/O
+    buffer = io.BytesIO(photo.stream.read())
+    current_app.executor.submit(
+        _write_profile_photo, buffer, save_path, old_path
+    )
 
     current_user.profile_photo = filename
     db.session.commit()
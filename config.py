@@ -1,5 +1,6 @@
 """Application configuration, including database and file upload settings."""
 import os
+from functools import lru_cache
 
 basedir = os.path.abspath(os.path.dirname(__file__))
 
@@ -8,6 +9,36 @@ class Config:
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or \
         'sqlite:///' + os.path.join(basedir, 'app.db')
 
+    # Keep compiled statements cached across requests so hot-path
+    # queries (e.g. the per-request user load) skip SQL compilation,
+    # recycle connections on a timer instead of paying a liveness
+    # round-trip on every checkout
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'query_cache_size': 1200,
+        'pool_pre_ping': False,
+        'pool_recycle': 1800,
+    }
+    if os.environ.get('DATABASE_URL'):
+        # Production Postgres: a deeper pool absorbs request bursts
+        # without opening new connections mid-request
+        SQLALCHEMY_ENGINE_OPTIONS.update({
+            'pool_size': 20,
+            'max_overflow': 40,
+        })
+
+    # When set (e.g. redis://localhost:6379/0), sessions move from the
+    # signed cookie to Redis: the cookie shrinks to a session id and
+    # requests skip deserialising/verifying the full session payload
+    SESSION_REDIS_URL = os.environ.get('SESSION_REDIS_URL')
+
+    # Argon2 cost parameters for password hashing, overridable per
+    # deployment so a single verify can be calibrated to a
+    # ~150-250ms budget on the production hardware. Defaults follow
+    # the OWASP argon2id baseline (19 MiB, 2 iterations, 1 lane).
+    ARGON2_TIME_COST = int(os.environ.get('ARGON2_TIME_COST', 2))
+    ARGON2_MEMORY_COST = int(os.environ.get('ARGON2_MEMORY_COST', 19456))
+    ARGON2_PARALLELISM = int(os.environ.get('ARGON2_PARALLELISM', 1))
+
     # Where to save profile photos
     PROFILE_PHOTO_FOLDER = os.path.join(
         basedir,
@@ -18,12 +49,15 @@ class Config:
     )
 
     MAX_CONTENT_LENGTH = 2 * 1024 * 1024
-    ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg'}
+    ALLOWED_EXTENSIONS = frozenset({'png', 'jpg', 'jpeg'})
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def allowed_file(filename: str) -> bool:
-        """Return True if `filename` has an allowed extension."""
-        if '.' not in filename:
-            return False
-        ext = filename.rsplit('.', 1)[1].lower()
+        """Return True if `filename` has an allowed extension.
+
+        Memoized: repeat uploads of common filenames skip the split
+        and membership test entirely.
+        """
+        ext = filename.rpartition('.')[2].lower()
         return ext in Config.ALLOWED_EXTENSIONS
\ No newline at end of file
@@ -0,0 +1,47 @@
+"""add denormalized answer counts to user module progress
+
+Revision ID: 5093c2440ccd
+Revises: 5c3214678ac1
+Create Date: 2026-08-30 13:35:29.256590
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5093c2440ccd'
+down_revision = '5c3214678ac1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('user_module_progress', schema=None) as batch_op:
+        batch_op.add_column(sa.Column(
+            'correct_count', sa.Integer(), nullable=False, server_default='0'
+        ))
+        batch_op.add_column(sa.Column(
+            'total_count', sa.Integer(), nullable=False, server_default='0'
+        ))
+
+    # Backfill the tallies for existing attempts from their answer rows
+    op.execute(
+        """
+        UPDATE user_module_progress SET
+            correct_count = COALESCE((
+                SELECT SUM(is_correct) FROM user_question_answer
+                WHERE user_question_answer.progress_id = user_module_progress.id
+            ), 0),
+            total_count = COALESCE((
+                SELECT COUNT(*) FROM user_question_answer
+                WHERE user_question_answer.progress_id = user_module_progress.id
+            ), 0)
+        """
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('user_module_progress', schema=None) as batch_op:
+        batch_op.drop_column('total_count')
+        batch_op.drop_column('correct_count')
@@ -0,0 +1,86 @@
+"""store document category and report type as small integers
+
+Revision ID: 5f74e9523d19
+Revises: e2e8c62bd499
+Create Date: 2026-08-30 13:39:50.837356
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5f74e9523d19'
+down_revision = 'e2e8c62bd499'
+branch_labels = None
+depends_on = None
+
+_CATEGORY_VALUES = {'Policy': 1, 'Guide': 2, 'Form': 3}
+_REPORT_VALUES = {'Completion': 1, 'Performance': 2}
+
+
+def _convert(table, column, enum_name, mapping):
+    is_postgres = op.get_bind().dialect.name == 'postgresql'
+    if is_postgres:
+        cases = ' '.join(
+            f"WHEN '{label}' THEN {value}" for label, value in mapping.items()
+        )
+        op.execute(
+            f'ALTER TABLE {table} ALTER COLUMN {column} '
+            f'TYPE smallint USING (CASE {column}::text {cases} END)'
+        )
+        op.execute(f'DROP TYPE IF EXISTS {enum_name}')
+        return
+    for label, value in mapping.items():
+        op.execute(
+            f"UPDATE {table} SET {column} = {value} WHERE {column} = '{label}'"
+        )
+    with op.batch_alter_table(table, schema=None) as batch_op:
+        batch_op.alter_column(
+            column,
+            existing_type=sa.VARCHAR(),
+            type_=sa.SmallInteger(),
+            existing_nullable=False
+        )
+
+
+def _revert(table, column, enum_name, mapping):
+    is_postgres = op.get_bind().dialect.name == 'postgresql'
+    labels = ', '.join(f"'{label}'" for label in mapping)
+    if is_postgres:
+        op.execute(f'CREATE TYPE {enum_name} AS ENUM ({labels})')
+        cases = ' '.join(
+            f"WHEN {value} THEN '{label}'" for label, value in mapping.items()
+        )
+        op.execute(
+            f'ALTER TABLE {table} ALTER COLUMN {column} '
+            f'TYPE {enum_name} USING (CASE {column} {cases} END)::{enum_name}'
+        )
+        return
+    for label, value in mapping.items():
+        op.execute(
+            f"UPDATE {table} SET {column} = '{label}' WHERE {column} = {value}"
+        )
+    with op.batch_alter_table(table, schema=None) as batch_op:
+        batch_op.alter_column(
+            column,
+            existing_type=sa.SmallInteger(),
+            type_=sa.Enum(*mapping, name=enum_name),
+            existing_nullable=False
+        )
+
+
+def upgrade():
+    _convert(
+        'document_repository', 'document_category',
+        'document_category', _CATEGORY_VALUES
+    )
+    _convert('report', 'report_type', 'report_type', _REPORT_VALUES)
+
+
+def downgrade():
+    _revert('report', 'report_type', 'report_type', _REPORT_VALUES)
+    _revert(
+        'document_repository', 'document_category',
+        'document_category', _CATEGORY_VALUES
+    )
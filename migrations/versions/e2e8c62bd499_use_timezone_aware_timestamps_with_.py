@@ -0,0 +1,74 @@
+"""use timezone aware timestamps with server defaults
+
+Revision ID: e2e8c62bd499
+Revises: 67ca7dbe0933
+Create Date: 2026-08-30 13:39:09.040874
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2e8c62bd499'
+down_revision = '67ca7dbe0933'
+branch_labels = None
+depends_on = None
+
+# (table, column, nullable) triples for every stored timestamp
+_TIMESTAMP_COLUMNS = [
+    ('user', 'dateStarted', True),
+    ('user_module_progress', 'start_date', False),
+    ('user_module_progress', 'completed_date', True),
+    ('document_repository', 'upload_date', False),
+    ('report', 'created_at', False),
+    ('module_completion_stats', 'refreshed_at', False),
+]
+
+# Columns that previously relied on a Python-side default and now get
+# the database's own clock as a server default
+_SERVER_DEFAULT_COLUMNS = {
+    ('user', 'dateStarted'),
+    ('user_module_progress', 'start_date'),
+    ('document_repository', 'upload_date'),
+    ('report', 'created_at'),
+}
+
+
+def upgrade():
+    is_postgres = op.get_bind().dialect.name == 'postgresql'
+    for table, column, nullable in _TIMESTAMP_COLUMNS:
+        kwargs = {}
+        if is_postgres:
+            # Existing naive values were written as UTC
+            kwargs['postgresql_using'] = f'"{column}" AT TIME ZONE \'UTC\''
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.alter_column(
+                column,
+                existing_type=sa.DateTime(),
+                type_=sa.DateTime(timezone=True),
+                existing_nullable=nullable,
+                server_default=(
+                    sa.func.now()
+                    if (table, column) in _SERVER_DEFAULT_COLUMNS
+                    else None
+                ),
+                **kwargs
+            )
+
+
+def downgrade():
+    is_postgres = op.get_bind().dialect.name == 'postgresql'
+    for table, column, nullable in reversed(_TIMESTAMP_COLUMNS):
+        kwargs = {}
+        if is_postgres:
+            kwargs['postgresql_using'] = f'"{column}" AT TIME ZONE \'UTC\''
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.alter_column(
+                column,
+                existing_type=sa.DateTime(timezone=True),
+                type_=sa.DateTime(),
+                existing_nullable=nullable,
+                server_default=None,
+                **kwargs
+            )
@@ -0,0 +1,35 @@
+"""unique open attempt per user and module
+
+Revision ID: f8ff352ce8be
+Revises: 5b8fc30cc32f
+Create Date: 2026-08-30 14:04:14.601252
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f8ff352ce8be'
+down_revision = '5b8fc30cc32f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Partial unique index: at most one open (completed_date IS NULL)
+    # attempt per user and module, backing the race-safe
+    # INSERT ... ON CONFLICT DO NOTHING in the quiz GET branch
+    with op.batch_alter_table('user_module_progress', schema=None) as batch_op:
+        batch_op.create_index(
+            'uq_ump_open_attempt',
+            ['user_id', 'training_module_id'],
+            unique=True,
+            sqlite_where=sa.text('completed_date IS NULL'),
+            postgresql_where=sa.text('completed_date IS NULL'),
+        )
+
+
+def downgrade():
+    with op.batch_alter_table('user_module_progress', schema=None) as batch_op:
+        batch_op.drop_index('uq_ump_open_attempt')
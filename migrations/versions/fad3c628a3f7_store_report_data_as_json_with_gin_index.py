@@ -0,0 +1,43 @@
+"""store report data as json with gin index
+
+Revision ID: fad3c628a3f7
+Revises: 5093c2440ccd
+Create Date: 2026-08-30 13:36:12.011693
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'fad3c628a3f7'
+down_revision = '5093c2440ccd'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('report', schema=None) as batch_op:
+        batch_op.alter_column(
+            'report_data',
+            existing_type=sa.TEXT(),
+            type_=sa.JSON().with_variant(postgresql.JSONB(), 'postgresql'),
+            existing_nullable=True,
+            postgresql_using='report_data::jsonb'
+        )
+        batch_op.create_index(
+            'ix_report_data_gin', ['report_data'],
+            unique=False, postgresql_using='gin'
+        )
+
+
+def downgrade():
+    with op.batch_alter_table('report', schema=None) as batch_op:
+        batch_op.drop_index('ix_report_data_gin', postgresql_using='gin')
+        batch_op.alter_column(
+            'report_data',
+            existing_type=sa.JSON().with_variant(postgresql.JSONB(), 'postgresql'),
+            type_=sa.TEXT(),
+            existing_nullable=True,
+            postgresql_using='report_data::text'
+        )
@@ -1,37 +1,26 @@
 # Code created with support of Miguel Grinberg's The Flash Mega Tutorial series
 # https://blog.miguelgrinberg.com/post/the-flask-mega-tutorial-part-iv-database
 """Entrypoint for the Vision Hub application."""
+import os
+
 import sqlalchemy as sa
 import sqlalchemy.orm as so
 
 from app import app, db
-from app.models import (
-    User, 
-    Role, 
-    Department, 
-    TrainingModule, 
-    Question, 
-    Option, 
-    UserModuleProgress, 
-    UserQuestionAnswer
-)
+from app import models
+
 
 @app.shell_context_processor
 def make_shell_context():
-    """Provide names and objects to the Flask shell for quick access."""
-    return {
-        'sa': sa, 
-        'so': so, 
-        'db': db, 
-        'User': User, 
-        'Role': Role, 
-        'Department': Department,
-        'TrainingModule': TrainingModule,
-        'Question': Question,
-        'Option': Option,
-        'UserModuleProgress': UserModuleProgress,
-        'UserQuestionAnswer': UserQuestionAnswer,
-        }
+    """Provide names and objects to the Flask shell for quick access.
+
+    The model names come from `app.models.__all__`, so new models are
+    available in the shell without editing this file.
+    """
+    context = {'sa': sa, 'so': so, 'db': db}
+    context.update({name: getattr(models, name) for name in models.__all__})
+    return context
+
 
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 8000))